@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 from dataclasses import dataclass, field
+from typing import Tuple
 
 from ....dataclass.configurations import OpenspeechDataclass
 
@@ -42,6 +43,8 @@ class SpectrogramConfigs(OpenspeechDataclass):
         frame_shift (float): length of hop between STFT (default: 10.0)
         del_silence (bool): flag indication whether to apply delete silence or not (default: False)
         num_mels (int): the number of mfc coefficients to retain. (default: 161)
+        extract_on_device (bool): flag indication whether to extract spectrogram by the model on its device
+            instead of the data loader (default: False)
     """
     name: str = field(
         default="spectrogram", metadata={"help": "Name of dataset."}
@@ -62,3 +65,38 @@ class SpectrogramConfigs(OpenspeechDataclass):
         default=161, metadata={"help": "Spectrogram is independent of mel, but uses the 'num_mels' variable "
                                        "to unify feature size variables "}
     )
+    extract_on_device: bool = field(
+        default=False, metadata={"help": "Flag indication whether to extract spectrogram by the model on its device "
+                                         "instead of the data loader. If True, the dataset yields raw waveforms."}
+    )
+
+
+def extracts_on_device(configs) -> bool:
+    r"""
+    Returns whether spectrograms are extracted by the model on its device instead of the data loader.
+    Configs saved before ``extract_on_device`` existed are treated as extracting in the data loader.
+
+    Args:
+        configs: audio configuration set, e.g. ``configs.audio``
+    """
+    return configs.name == "spectrogram" and getattr(configs, "extract_on_device", False)
+
+
+def get_stft_parameters(configs) -> Tuple[int, int]:
+    r"""
+    Returns the FFT size and hop length (in samples) of the spectrogram described by audio configs.
+
+    Args:
+        configs: audio configuration set, e.g. ``configs.audio``
+
+    Returns:
+        n_fft (int), hop_length (int)
+    """
+    n_fft = int(round(configs.sample_rate * 0.001 * configs.frame_length))
+    hop_length = int(round(configs.sample_rate * 0.001 * configs.frame_shift))
+    return n_fft, hop_length
+
+
+def get_num_frames(num_samples: int, n_fft: int, hop_length: int) -> int:
+    r""" Returns the number of STFT frames (``center=False``) of a signal with `num_samples` samples. """
+    return (num_samples - n_fft) // hop_length + 1
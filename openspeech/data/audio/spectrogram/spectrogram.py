@@ -21,18 +21,20 @@
 # SOFTWARE.
 
 import numpy as np
-import torch
+import scipy.fft
+from numpy.lib.stride_tricks import sliding_window_view
 from omegaconf import DictConfig
-from torch import Tensor
 
 from ... import register_audio_feature_transform
-from ...audio.spectrogram.configuration import SpectrogramConfigs
+from ...audio.spectrogram.configuration import SpectrogramConfigs, get_stft_parameters
 
 
 @register_audio_feature_transform("spectrogram", dataclass=SpectrogramConfigs)
 class SpectrogramFeatureTransform(object):
     r"""
     Create a spectrogram from a audio signal.
+    The signal is framed with a strided view and transformed with pocketfft's real FFT, which avoids
+    PyTorch's per-call dispatch overhead in the data loader workers.
 
     Configurations:
         name (str): name of feature transform. (default: spectrogram)
@@ -41,6 +43,8 @@ class SpectrogramFeatureTransform(object):
         frame_shift (float): length of hop between STFT (default: 10.0)
         del_silence (bool): flag indication whether to apply delete silence or not (default: False)
         num_mels (int): the number of mfc coefficients to retain. (default: 161)
+        extract_on_device (bool): flag indication whether to extract spectrogram by the model on its device
+            instead of the data loader (default: False)
 
     Args:
         configs (DictConfig): configuraion set
@@ -50,9 +54,13 @@ class SpectrogramFeatureTransform(object):
     """
     def __init__(self, configs: DictConfig) -> None:
         super(SpectrogramFeatureTransform, self).__init__()
-        self.n_fft = int(round(configs.audio.sample_rate * 0.001 * configs.audio.frame_length))
-        self.hop_length = int(round(configs.audio.sample_rate * 0.001 * configs.audio.frame_shift))
-        self.function = torch.stft
+        self.n_fft, self.hop_length = get_stft_parameters(configs.audio)
+        self.num_mels = configs.audio.num_mels
+        if self.num_mels > self.n_fft // 2 + 1:
+            raise ValueError(f"num_mels ({self.num_mels}) should be at most n_fft // 2 + 1 ({self.n_fft // 2 + 1})")
+        n = np.arange(self.n_fft, dtype=np.float32)
+        self.window = 0.54 - 0.46 * np.cos(2 * np.pi * n / self.n_fft, dtype=np.float32)
+        self.function = scipy.fft.rfft
 
     def _get_feature(self, signal: np.ndarray) -> np.ndarray:
         """
@@ -64,11 +72,7 @@ class SpectrogramFeatureTransform(object):
         Returns:
             feature (np.ndarray): feature extract by sub-class
         """
-        spectrogram = self.function(
-            Tensor(signal), self.n_fft, hop_length=self.hop_length,
-            win_length=self.n_fft, window=torch.hamming_window(self.n_fft),
-            center=False, normalized=False, onesided=True
-        )
-        spectrogram = (spectrogram[:, :, 0].pow(2) + spectrogram[:, :, 1].pow(2)).pow(0.5)
-        spectrogram = np.log1p(spectrogram.numpy())
-        return spectrogram
+        frames = sliding_window_view(signal.astype(np.float32, copy=False), self.n_fft)[::self.hop_length]
+        spectrogram = self.function(frames * self.window, axis=-1, overwrite_x=True)
+        spectrogram = np.abs(spectrogram[:, :self.num_mels])
+        return np.log1p(spectrogram, out=spectrogram).T
@@ -22,19 +22,27 @@
 
 import torch
 import numpy as np
+from functools import partial
+from typing import Optional
 from torch.utils.data import DataLoader, Sampler
 
+from .audio.spectrogram.configuration import get_num_frames
 
-def _collate_fn(batch, pad_id: int = 0):
+
+def _collate_fn(batch, pad_id: int = 0, n_fft: Optional[int] = None, hop_length: Optional[int] = None):
     r"""
     Functions that pad to the maximum sequence length
 
     Args:
         batch (tuple): tuple contains input and target tensors
         pad_id (int): identification of pad token
+        n_fft (int, optional): size of FFT. if given with `hop_length`, inputs are raw signals which are padded
+            up to a frame boundary, and seq_lengths are returned as the number of STFT frames instead of the
+            number of samples
+        hop_length (int, optional): length of hop between STFT windows
 
     Returns:
-        seqs (torch.FloatTensor): tensor contains input sequences.
+        seqs (torch.FloatTensor): tensor contains input sequences (features or raw signals).
         target (torch.IntTensor): tensor contains target sequences.
         seq_lengths (torch.IntTensor): tensor contains input sequence lengths
         target_lengths (torch.IntTensor): tensor contains target sequence lengths
@@ -57,10 +65,14 @@ def _collate_fn(batch, pad_id: int = 0):
     max_seq_size = max_seq_sample.size(0)
     max_target_size = len(max_target_sample)
 
-    feat_size = max_seq_sample.size(1)
+    feat_size = max_seq_sample.size()[1:]
     batch_size = len(batch)
 
-    seqs = torch.zeros(batch_size, max_seq_size, feat_size)
+    if n_fft is not None and hop_length is not None:
+        # round up to a frame boundary so that the STFT consumes the padded batch without a partial tail
+        max_seq_size = n_fft + hop_length * max(-(-(max_seq_size - n_fft) // hop_length), 0)
+
+    seqs = torch.zeros(batch_size, max_seq_size, *feat_size, dtype=max_seq_sample.dtype)
 
     targets = torch.zeros(batch_size, max_target_size).to(torch.long)
     targets.fill_(pad_id)
@@ -74,6 +86,9 @@ def _collate_fn(batch, pad_id: int = 0):
         seqs[x].narrow(0, 0, seq_length).copy_(tensor)
         targets[x].narrow(0, 0, len(target)).copy_(torch.LongTensor(target))
 
+    if n_fft is not None and hop_length is not None:
+        seq_lengths = [get_num_frames(seq_length, n_fft, hop_length) for seq_length in seq_lengths]
+
     seq_lengths = torch.IntTensor(seq_lengths)
     target_lengths = torch.IntTensor(target_lengths)
 
@@ -88,21 +103,27 @@ class AudioDataLoader(DataLoader):
         dataset (torch.utils.data.Dataset): dataset from which to load the data.
         num_workers (int): how many subprocesses to use for data loading.
         batch_sampler (torch.utils.data.sampler.Sampler): defines the strategy to draw samples from the dataset.
+        pin_memory (bool): flag indication whether to copy batches into pinned memory, so that the transfer to GPU
+            runs asynchronously. set it only when training on GPU, ignored if CUDA is not available. (default: False)
     """
     def __init__(
             self,
             dataset: torch.utils.data.Dataset,
             num_workers: int,
             batch_sampler: torch.utils.data.sampler.Sampler,
+            pin_memory: bool = False,
             **kwargs,
     ) -> None:
         super(AudioDataLoader, self).__init__(
             dataset=dataset,
             num_workers=num_workers,
             batch_sampler=batch_sampler,
+            pin_memory=pin_memory and torch.cuda.is_available(),
             **kwargs,
         )
         self.collate_fn = _collate_fn
+        if getattr(dataset, "extract_on_device", False):
+            self.collate_fn = partial(_collate_fn, n_fft=dataset.n_fft, hop_length=dataset.hop_length)
 
 
 class BucketingSampler(Sampler):
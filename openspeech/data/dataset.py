@@ -32,6 +32,7 @@ from torch.utils.data import Dataset
 from . import AUDIO_FEATURE_TRANSFORM_DATACLASS_REGISTRY
 from .audio.augment import JoiningAugment, NoiseInjector, SpecAugment, TimeStretchAugment
 from .audio.load import load_audio
+from .audio.spectrogram.configuration import extracts_on_device, get_stft_parameters
 
 logger = logging.getLogger(__name__)
 
@@ -90,10 +91,20 @@ class SpeechToTextDataset(Dataset):
         self.apply_noise_augment = apply_noise_augment
         self.apply_time_stretch_augment = apply_time_stretch_augment
         self.apply_joining_augment = apply_joining_augment
+        self.extract_on_device = extracts_on_device(configs.audio)
+        if self.extract_on_device:
+            self.n_fft, self.hop_length = get_stft_parameters(configs.audio)
+        self.feature_dtype = torch.float32
+        # only the CUDA mixed precision trainer consumes float16 inputs; TPUs train fp16 configs in bfloat16
+        if configs.trainer.name == "gpu-fp16" and configs.trainer.precision == 16:
+            self.feature_dtype = torch.float16
         self.transforms = AUDIO_FEATURE_TRANSFORM_DATACLASS_REGISTRY[configs.name](configs)
         self._load_audio = load_audio
 
         if self.apply_spec_augment:
+            if self.extract_on_device:
+                raise ValueError("SpecAugment can't be applied when the spectrogram is extracted on device.")
+
             self._spec_augment = SpecAugment(
                 freq_mask_para=configs.augment.freq_mask_para,
                 freq_mask_num=configs.augment.freq_mask_num,
@@ -150,13 +161,15 @@ class SpeechToTextDataset(Dataset):
             augment (int): augmentation identification
 
         Returns:
-            feature (np.ndarray): feature extract by sub-class
+            feature (np.ndarray): feature extract by sub-class, or raw signal if `extract_on_device` is set
         """
         signal = self._load_audio(audio_path, sample_rate=self.sample_rate, del_silence=self.del_silence)
 
         if signal is None:
             logger.warning(f"{audio_path} is not Valid!!")
-            return torch.zeros(1000, self.num_mels)
+            if self.extract_on_device:
+                return torch.zeros(self.sample_rate)
+            return torch.zeros(1000, self.num_mels, dtype=self.feature_dtype)
 
         if augment == self.AUDIO_JOINING:
             joining_signal = self._load_audio(self.audio_paths[joining_idx], sample_rate=self.sample_rate)
@@ -168,6 +181,14 @@ class SpeechToTextDataset(Dataset):
         if augment == self.NOISE_AUGMENT:
             signal = self._noise_injector(signal)
 
+        signal = np.ascontiguousarray(signal, dtype=np.float32)
+
+        if self.extract_on_device:
+            if len(signal) < self.n_fft:
+                # zero-pad to a single frame so that every utterance yields at least one STFT frame
+                signal = np.pad(signal, (0, self.n_fft - len(signal)))
+            return torch.from_numpy(signal)
+
         feature = self.transforms(signal)
 
         feature -= feature.mean()
@@ -178,7 +199,7 @@ class SpeechToTextDataset(Dataset):
         if augment == self.SPEC_AUGMENT:
             feature = self._spec_augment(feature)
 
-        return feature
+        return feature.to(self.feature_dtype)
 
     def _parse_transcript(self, transcript: str) -> list:
         """
@@ -161,6 +161,7 @@ class LightningAIShellDataModule(pl.LightningDataModule):
             dataset=self.dataset['train'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=train_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
 
     def val_dataloader(self) -> DataLoader:
@@ -169,6 +170,7 @@ class LightningAIShellDataModule(pl.LightningDataModule):
             dataset=self.dataset['valid'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=valid_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
 
     def test_dataloader(self) -> DataLoader:
@@ -177,4 +179,5 @@ class LightningAIShellDataModule(pl.LightningDataModule):
             dataset=self.dataset['test'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=test_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
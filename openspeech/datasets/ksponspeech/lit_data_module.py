@@ -175,6 +175,7 @@ class LightningKsponSpeechDataModule(pl.LightningDataModule):
             dataset=self.dataset['train'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=train_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
 
     def val_dataloader(self) -> AudioDataLoader:
@@ -184,6 +185,7 @@ class LightningKsponSpeechDataModule(pl.LightningDataModule):
             dataset=self.dataset['valid'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=valid_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
 
     def test_dataloader(self) -> AudioDataLoader:
@@ -193,4 +195,5 @@ class LightningKsponSpeechDataModule(pl.LightningDataModule):
             dataset=self.dataset['test'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=train_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
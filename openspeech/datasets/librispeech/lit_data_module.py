@@ -196,6 +196,7 @@ class LightningLibriSpeechDataModule(pl.LightningDataModule):
             dataset=self.dataset['train'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=train_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
 
     def val_dataloader(self) -> DataLoader:
@@ -204,6 +205,7 @@ class LightningLibriSpeechDataModule(pl.LightningDataModule):
             dataset=self.dataset['valid'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=valid_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
 
     def test_dataloader(self) -> DataLoader:
@@ -212,4 +214,5 @@ class LightningLibriSpeechDataModule(pl.LightningDataModule):
             dataset=self.dataset['test'],
             num_workers=self.configs.trainer.num_workers,
             batch_sampler=test_sampler,
+            pin_memory=self.configs.trainer.device == "gpu",
         )
@@ -48,6 +48,8 @@ class ConformerConfigs(OpenspeechDataclass):
         conv_dropout_p (float): The dropout probability of convolution module. (default: 0.1)
         conv_kernel_size (int): The kernel size of convolution. (default: eq)
         half_step_residual (bool): Flag indication whether to use half step residual or not (default: True)
+        compile_output_layer (bool): Flag indication whether to compile the output projection and log_softmax
+            with torch.compile, requires torch>=2.2 (default: False)
         optimizer (str): Optimizer for training. (default: adam)
     """
     model_name: str = field(
@@ -86,6 +88,10 @@ class ConformerConfigs(OpenspeechDataclass):
     half_step_residual: bool = field(
         default=True, metadata={"help": "Flag indication whether to use half step residual or not"}
     )
+    compile_output_layer: bool = field(
+        default=False, metadata={"help": "Flag indication whether to compile the output projection and log_softmax "
+                                         "with torch.compile. Requires torch>=2.2"}
+    )
     optimizer: str = field(
         default="adam", metadata={"help": "Optimizer for training."}
     )
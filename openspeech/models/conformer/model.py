@@ -20,16 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import torch
 from omegaconf import DictConfig
 from torch import Tensor
-from typing import Dict
+from typing import Dict, Tuple
 from collections import OrderedDict
 
+from openspeech.data.audio.spectrogram.configuration import extracts_on_device, get_stft_parameters
 from openspeech.models import register_model
 from openspeech.models import OpenspeechCTCModel
 from openspeech.models.conformer.configurations import ConformerConfigs
 from openspeech.encoders import ConformerEncoder
-from openspeech.modules.wrapper import Linear
+from openspeech.modules import BatchedSpectrogram
+from openspeech.modules.wrapper import LogSoftmaxLinear
 from openspeech.vocabs.vocab import Vocabulary
 
 
@@ -47,12 +50,37 @@ class ConformerModel(OpenspeechCTCModel):
             `FloatTensor` of size ``(batch, seq_length, dimension)``.
         input_lengths (torch.LongTensor): The length of input tensor. ``(batch)``
 
+    Note:
+        If ``configs.audio.extract_on_device`` is set, batches contain raw waveforms of size ``(batch, num_samples)``
+        and the spectrogram is extracted on the model's device before the encoder. In that case `input_lengths`
+        are the number of STFT frames, ``(num_samples - n_fft) // hop_length + 1``, as computed by the data loader.
+
     Returns:
-        * dict (dict): Result of model predictions that contains `y_hats`, `logits`, `output_lengths`
+        * dict (dict): Result of model predictions that contains `y_hats`, `logits`, `output_lengths`.
+          In training mode, or if a beam search decoder is set, `logits` are log probabilities of size
+          ``(batch, seq_length, num_classes)``. In evaluation mode without a decoder, only the argmax is needed,
+          so `logits` are the unnormalized outputs of the final projection and the log_softmax is skipped.
     """
+    supports_extract_on_device = True
+
     def __init__(self, configs: DictConfig, vocab: Vocabulary,) -> None:
         super(ConformerModel, self).__init__(configs, vocab)
-        self.fc = Linear(self.configs.model.encoder_dim, self.num_classes, bias=False)
+        self.fc = LogSoftmaxLinear(self.configs.model.encoder_dim, self.num_classes, bias=False)
+
+        if getattr(self.configs.model, "compile_output_layer", False):
+            if not hasattr(self.fc, "compile"):
+                raise ValueError("`compile_output_layer` requires torch>=2.2")
+            self.fc.compile(dynamic=True)
+
+        if extracts_on_device(self.configs.audio):
+            n_fft, hop_length = get_stft_parameters(self.configs.audio)
+            self.spectrogram = torch.jit.script(BatchedSpectrogram(
+                n_fft=n_fft,
+                hop_length=hop_length,
+                num_mels=self.configs.audio.num_mels,
+            ))
+        else:
+            self.spectrogram = None
 
     def build_model(self):
         self.encoder = ConformerEncoder(
@@ -72,6 +100,24 @@ class ConformerModel(OpenspeechCTCModel):
             joint_ctc_attention=False,
         )
 
+    def _encode(self, inputs: Tensor, input_lengths: Tensor, normalize: bool = True) -> Tuple[Tensor, Tensor]:
+        r"""
+        Extracts spectrograms if the model computes them on device, then encodes and projects the inputs.
+
+        Inputs:
+            inputs (torch.FloatTensor): padded input sequences or raw waveforms passed to encoders
+            input_lengths (torch.LongTensor): The length of input tensor. ``(batch)``
+            normalize (bool): if False, the log_softmax over the projection is skipped
+
+        Returns:
+            * logits (torch.FloatTensor): output of the final projection, log probabilities if `normalize` is set
+            * output_lengths (torch.LongTensor): The length of output tensor. ``(batch)``
+        """
+        if self.spectrogram is not None:
+            inputs, input_lengths = self.spectrogram(inputs, input_lengths)
+        encoder_outputs, encoder_logits, output_lengths = self.encoder(inputs, input_lengths)
+        return self.fc(encoder_outputs, normalize=normalize), output_lengths
+
     def forward(self, inputs: Tensor, input_lengths: Tensor) -> Dict[str, Tensor]:
         r"""
         Forward propagate a `inputs` and `targets` pair for inference.
@@ -84,30 +130,54 @@ class ConformerModel(OpenspeechCTCModel):
         Returns:
             * dict (dict): Result of model predictions that contains `y_hats`, `logits`, `output_lengths`
         """
-        return super(ConformerModel, self).forward(inputs, input_lengths)
+        logits, output_lengths = self._encode(
+            inputs, input_lengths, normalize=self.training or self.decoder is not None,
+        )
 
-    def training_step(self, batch: tuple, batch_idx: int) -> OrderedDict:
+        if self.decoder is not None:
+            y_hats = self.decoder(logits)
+        else:
+            y_hats = logits.argmax(dim=-1)
+        return {
+            "y_hats": y_hats,
+            "logits": logits,
+            "output_lengths": output_lengths,
+        }
+
+    def _step(self, stage: str, batch: tuple) -> OrderedDict:
         r"""
-        Forward propagate a `inputs` and `targets` pair for training.
+        Forward propagate a `inputs` and `targets` pair and collect outputs for the given stage.
 
         Inputs:
-            batch (tuple): A train batch contains `inputs`, `targets`, `input_lengths`, `target_lengths`
-            batch_idx (int): The index of batch
+            stage (str): current stage (train, valid, test)
+            batch (tuple): A batch contains `inputs`, `targets`, `input_lengths`, `target_lengths`
 
         Returns:
-            loss (torch.Tensor): loss for training
+            outputs (OrderedDict): `loss` and logs collected by `collect_outputs`
         """
         inputs, targets, input_lengths, target_lengths = batch
-        encoder_outputs, encoder_logits, output_lengths = self.encoder(inputs, input_lengths)
-        logits = self.fc(encoder_outputs).log_softmax(dim=-1)
+        logits, output_lengths = self._encode(inputs, input_lengths)
         return self.collect_outputs(
-            stage='train',
+            stage=stage,
             logits=logits,
             output_lengths=output_lengths,
             targets=targets,
             target_lengths=target_lengths,
         )
 
+    def training_step(self, batch: tuple, batch_idx: int) -> OrderedDict:
+        r"""
+        Forward propagate a `inputs` and `targets` pair for training.
+
+        Inputs:
+            batch (tuple): A train batch contains `inputs`, `targets`, `input_lengths`, `target_lengths`
+            batch_idx (int): The index of batch
+
+        Returns:
+            loss (torch.Tensor): loss for training
+        """
+        return self._step('train', batch)
+
     def validation_step(self, batch: tuple, batch_idx: int) -> OrderedDict:
         r"""
         Forward propagate a `inputs` and `targets` pair for validation.
@@ -119,16 +189,7 @@ class ConformerModel(OpenspeechCTCModel):
         Returns:
             loss (torch.Tensor): loss for training
         """
-        inputs, targets, input_lengths, target_lengths = batch
-        encoder_outputs, encoder_logits, output_lengths = self.encoder(inputs, input_lengths)
-        logits = self.fc(encoder_outputs).log_softmax(dim=-1)
-        return self.collect_outputs(
-            stage='valid',
-            logits=logits,
-            output_lengths=output_lengths,
-            targets=targets,
-            target_lengths=target_lengths,
-        )
+        return self._step('valid', batch)
 
     def test_step(self, batch: tuple, batch_idx: int) -> OrderedDict:
         r"""
@@ -141,13 +202,4 @@ class ConformerModel(OpenspeechCTCModel):
         Returns:
             loss (torch.Tensor): loss for training
         """
-        inputs, targets, input_lengths, target_lengths = batch
-        encoder_outputs, encoder_logits, output_lengths = self.encoder(inputs, input_lengths)
-        logits = self.fc(encoder_outputs).log_softmax(dim=-1)
-        return self.collect_outputs(
-            stage='test',
-            logits=logits,
-            output_lengths=output_lengths,
-            targets=targets,
-            target_lengths=target_lengths,
-        )
+        return self._step('test', batch)
@@ -28,6 +28,7 @@ from omegaconf import DictConfig
 from torch import Tensor
 
 from openspeech.criterion import CRITERION_REGISTRY
+from openspeech.data.audio.spectrogram.configuration import extracts_on_device
 from openspeech.metrics import WordErrorRate, CharacterErrorRate
 from openspeech.optim.scheduler import SCHEDULER_REGISTRY
 from openspeech.utils import get_class_name
@@ -53,8 +54,13 @@ class OpenspeechModel(pl.LightningModule):
     Returns:
         * y_hats (torch.FloatTensor): Result of model predictions.
     """
+    # whether the model extracts spectrograms from raw waveforms itself when ``audio.extract_on_device`` is set
+    supports_extract_on_device = False
+
     def __init__(self, configs: DictConfig, vocab: Vocabulary) -> None:
         super(OpenspeechModel, self).__init__()
+        if extracts_on_device(configs.audio) and not self.supports_extract_on_device:
+            raise ValueError(f"{self.__class__.__name__} does not support `audio.extract_on_device`")
         self.configs = configs
         self.num_classes = len(vocab)
         self.gradient_clip_val = configs.trainer.gradient_clip_val
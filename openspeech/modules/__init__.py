@@ -20,10 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .wrapper import Linear, View, Transpose
+from .wrapper import Linear, LogSoftmaxLinear, View, Transpose
 from .additive_attention import AdditiveAttention
 from .add_normalization import AddNorm
 from .batchnorm_relu_rnn import BNReluRNN
+from .batched_spectrogram import BatchedSpectrogram
 from .conformer_attention_module import MultiHeadedSelfAttentionModule
 from .conformer_block import ConformerBlock
 from .conformer_convolution_module import ConformerConvModule
@@ -60,6 +61,7 @@ __all__ = [
     "AdditiveAttention",
     "AddNorm",
     "BNReluRNN",
+    "BatchedSpectrogram",
     "MultiHeadAttention",
     "ConformerBlock",
     "ConformerConvModule",
@@ -92,6 +94,7 @@ __all__ = [
     "TimeChannelSeparableConv1d",
     "TransformerEmbedding",
     "Linear",
+    "LogSoftmaxLinear",
     "View",
     "Transpose",
 ]
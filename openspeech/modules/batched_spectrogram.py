@@ -0,0 +1,93 @@
+# MIT License
+#
+# Copyright (c) 2021 Soohwan Kim and Sangchun Ha and Soyoung Cho
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+import torch
+import torch.nn as nn
+from torch import Tensor
+from typing import Tuple
+
+
+class BatchedSpectrogram(nn.Module):
+    r"""
+    Computes normalized log-magnitude spectrograms for a padded batch of raw waveforms.
+    It runs as a submodule of the model, so the STFT is computed once per batch on the model's device
+    instead of once per utterance in the data loader workers.
+
+    The STFT is computed by framing the waveforms with a strided view (``unfold``) and multiplying the frames with
+    a precomputed basis of windowed cosines and sines, one pair per retained frequency bin. This avoids per-call
+    FFT plan lookups and lets the magnitude and log1p be fused with the transform. The module is compatible with
+    :func:`torch.jit.script`.
+
+    Args:
+        n_fft (int): size of FFT, which is also used as the window length
+        hop_length (int): length of hop between STFT windows
+        num_mels (int): the number of frequency bins to retain, at most ``n_fft // 2 + 1``
+
+    Inputs: inputs, input_lengths
+        - **inputs** (batch, num_samples): Tensor containing padded raw waveforms
+        - **input_lengths** (batch): list of sequence input lengths in frames, i.e.
+          ``(num_samples - n_fft) // hop_length + 1``, computed on the host by the data loader
+
+    Returns: outputs, output_lengths
+        - **outputs** (batch, time, num_mels): Tensor containing spectrograms
+        - **output_lengths** (batch): list of sequence output lengths in frames
+    """
+    __constants__ = ['n_fft', 'hop_length', 'num_mels', 'eps']
+
+    def __init__(self, n_fft: int, hop_length: int, num_mels: int) -> None:
+        super(BatchedSpectrogram, self).__init__()
+        if num_mels > n_fft // 2 + 1:
+            raise ValueError(f"num_mels ({num_mels}) should be at most n_fft // 2 + 1 ({n_fft // 2 + 1})")
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.num_mels = num_mels
+        self.eps = 1e-5
+
+        n = torch.arange(n_fft)
+        k = torch.arange(num_mels)
+        window = 0.54 - 0.46 * torch.cos(2 * math.pi * n.float() / n_fft)
+
+        phase = 2 * math.pi * (k.unsqueeze(1) * n % n_fft).double() / n_fft
+        basis = torch.cat([window * torch.cos(phase), window * torch.sin(phase)], dim=0)
+        # derived from n_fft and num_mels, so it is kept out of the state_dict and checkpoints load across modes
+        self.register_buffer('basis', basis.float().t().contiguous(), persistent=False)
+
+    def _normalize(self, outputs: Tensor, output_lengths: Tensor) -> Tensor:
+        """ Normalizes each spectrogram to zero mean and unit variance, ignoring padded frames. """
+        mask = torch.arange(outputs.size(1), device=outputs.device).unsqueeze(0) < output_lengths.unsqueeze(1)
+        mask = mask.unsqueeze(-1)
+        num_elements = (output_lengths * outputs.size(2)).clamp(min=1).to(outputs.dtype).view(-1, 1, 1)
+
+        outputs = outputs.masked_fill(~mask, 0.0)
+        mean = outputs.sum(dim=(1, 2), keepdim=True) / num_elements
+        outputs = (outputs - mean).masked_fill_(~mask, 0.0)
+        # silent (e.g. all-zero) utterances have no variance, keep them at zero instead of dividing by it
+        std = (outputs.pow(2).sum(dim=(1, 2), keepdim=True) / num_elements).sqrt().clamp(min=self.eps)
+
+        return outputs / std
+
+    def forward(self, inputs: Tensor, input_lengths: Tensor) -> Tuple[Tensor, Tensor]:
+        outputs = torch.matmul(inputs.unfold(-1, self.n_fft, self.hop_length), self.basis)
+        real, imag = outputs.chunk(2, dim=-1)
+        outputs = torch.hypot(real, imag).log1p_()
+        return self._normalize(outputs, input_lengths), input_lengths
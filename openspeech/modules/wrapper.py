@@ -41,6 +41,19 @@ class Linear(nn.Module):
         return self.linear(x)
 
 
+class LogSoftmaxLinear(Linear):
+    r"""
+    Linear projection followed by log_softmax over the last dimension.
+    Keeping both ops in one module lets :func:`torch.compile` fuse the softmax normalization with the projection.
+    If ``normalize`` is False, the unnormalized projection is returned and the log_softmax is skipped.
+    """
+    def forward(self, x: Tensor, normalize: bool = True) -> Tensor:
+        outputs = self.linear(x)
+        if not normalize:
+            return outputs
+        return outputs.log_softmax(dim=-1)
+
+
 class View(nn.Module):
     r""" Wrapper class of torch.view() for Sequential module. """
     def __init__(self, shape: tuple, contiguous: bool = False):
@@ -32,9 +32,10 @@ setup(
     url='https://github.com/sooftware/openspeech',
     download_url='https://github.com/sooftware/openspeech/releases/tag/v0.1.zip',
     install_requires=[
-        'torch>=1.4.0',
+        'torch>=1.7.0',
         'python-Levenshtein',
-        'numpy',
+        'numpy>=1.20.0',
+        'scipy>=1.4.0',
         'pandas',
         'astropy',
         'sentencepiece',
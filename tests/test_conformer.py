@@ -4,8 +4,11 @@ import torch.nn as nn
 import logging
 
 from openspeech.criterion.ctc.ctc import CTCLossConfigs
+from openspeech.data.audio.spectrogram.configuration import SpectrogramConfigs, get_stft_parameters
+from openspeech.data.data_loader import _collate_fn
 from openspeech.models import ConformerConfigs, ConformerModel
 from openspeech.utils import DUMMY_INPUTS, DUMMY_INPUT_LENGTHS, DUMMY_TARGETS, DUMMY_TARGET_LENGTHS, build_dummy_configs
+from openspeech.utils import DUMMY_SIGNALS
 from openspeech.vocabs.ksponspeech.character import KsponSpeechCharacterVocabulary
 
 logger = logging.getLogger(__name__)
@@ -48,6 +51,29 @@ class TestConformer(unittest.TestCase):
             )
             assert type(outputs["loss"].item()) == float
 
+    def test_training_step_with_raw_signals(self):
+        configs = build_dummy_configs(
+            model_configs=ConformerConfigs(),
+            criterion_configs=CTCLossConfigs(),
+            audio_configs=SpectrogramConfigs(extract_on_device=True),
+        )
+
+        vocab = KsponSpeechCharacterVocabulary(configs)
+        model = ConformerModel(configs, vocab)
+        model.build_model()
+
+        n_fft, hop_length = get_stft_parameters(configs.audio)
+        signal = torch.FloatTensor(DUMMY_SIGNALS)
+        batch = _collate_fn(
+            [(signal[:signal.size(0) - 1600 * i], DUMMY_TARGETS[i].tolist()) for i in range(3)],
+            n_fft=n_fft,
+            hop_length=hop_length,
+        )
+
+        for i in range(5):
+            outputs = model.training_step(batch=batch, batch_idx=i)
+            assert type(outputs["loss"].item()) == float
+
     def test_validation_step(self):
         configs = build_dummy_configs(model_configs=ConformerConfigs(), criterion_configs=CTCLossConfigs())
 
@@ -74,6 +100,64 @@ class TestConformer(unittest.TestCase):
             )
             assert type(outputs["loss"].item()) == float
 
+    def test_forward(self):
+        configs = build_dummy_configs(model_configs=ConformerConfigs(), criterion_configs=CTCLossConfigs())
+
+        vocab = KsponSpeechCharacterVocabulary(configs)
+        model = ConformerModel(configs, vocab)
+        model.build_model()
+        model.eval()
+
+        with torch.no_grad():
+            outputs = model(DUMMY_INPUTS, DUMMY_INPUT_LENGTHS)
+
+        assert outputs["logits"].size()[:2] == outputs["y_hats"].size()
+        assert outputs["logits"].size(-1) == len(vocab)
+        assert torch.equal(outputs["y_hats"], outputs["logits"].argmax(dim=-1))
+
+    def test_forward_with_raw_signals(self):
+        configs = build_dummy_configs(
+            model_configs=ConformerConfigs(),
+            criterion_configs=CTCLossConfigs(),
+            audio_configs=SpectrogramConfigs(extract_on_device=True),
+        )
+
+        vocab = KsponSpeechCharacterVocabulary(configs)
+        model = ConformerModel(configs, vocab)
+        model.build_model()
+        model.eval()
+
+        n_fft, hop_length = get_stft_parameters(configs.audio)
+        signal = torch.FloatTensor(DUMMY_SIGNALS)
+        inputs, _, input_lengths, _ = _collate_fn(
+            [(signal[:signal.size(0) - 1600 * i], DUMMY_TARGETS[i].tolist()) for i in range(3)],
+            n_fft=n_fft,
+            hop_length=hop_length,
+        )
+
+        with torch.no_grad():
+            outputs = model(inputs, input_lengths)
+
+        assert outputs["logits"].size()[:2] == outputs["y_hats"].size()
+        assert outputs["logits"].size(-1) == len(vocab)
+        assert torch.equal(outputs["y_hats"], outputs["logits"].argmax(dim=-1))
+        assert outputs["output_lengths"].max() <= outputs["logits"].size(1)
+
+    def test_load_state_dict_across_extraction_modes(self):
+        models = list()
+        for extract_on_device in (False, True):
+            configs = build_dummy_configs(
+                model_configs=ConformerConfigs(),
+                criterion_configs=CTCLossConfigs(),
+                audio_configs=SpectrogramConfigs(extract_on_device=extract_on_device),
+            )
+            model = ConformerModel(configs, KsponSpeechCharacterVocabulary(configs))
+            model.build_model()
+            models.append(model)
+
+        models[1].load_state_dict(models[0].state_dict())
+        models[0].load_state_dict(models[1].state_dict())
+
 
 if __name__ == '__main__':
     unittest.main()
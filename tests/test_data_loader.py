@@ -0,0 +1,70 @@
+import unittest
+import torch
+
+from openspeech.data.audio.spectrogram.configuration import SpectrogramConfigs, get_num_frames
+from openspeech.data.data_loader import _collate_fn
+from openspeech.data.dataset import SpeechToTextDataset
+from openspeech.dataclass import CPUTrainerConfigs, Fp16GPUTrainerConfigs, Fp16TPUTrainerConfigs
+from openspeech.utils import build_dummy_configs
+
+
+class TestCollateFn(unittest.TestCase):
+    def test_collate_features(self):
+        batch = [
+            (torch.randn(100, 80), [1, 3, 3, 2]),
+            (torch.randn(120, 80), [1, 3, 2]),
+        ]
+        seqs, targets, seq_lengths, target_lengths = _collate_fn(batch)
+
+        assert seqs.size() == (2, 120, 80)
+        assert seq_lengths.tolist() == [120, 100]
+        assert target_lengths.tolist() == [2, 3]
+
+    def test_collate_raw_signals(self):
+        n_fft, hop_length = 320, 160
+        num_samples = [16050, 12345, 9000]
+        batch = [(torch.randn(length), [1, 3, 3, 2]) for length in num_samples]
+
+        seqs, targets, seq_lengths, target_lengths = _collate_fn(batch, n_fft=n_fft, hop_length=hop_length)
+
+        assert seqs.dim() == 2
+        assert seqs.size(0) == 3
+        assert seqs.size(1) == 16160
+        assert (seqs.size(1) - n_fft) % hop_length == 0
+        assert seqs[0, 16050:].abs().sum() == 0
+        assert seq_lengths.tolist() == [get_num_frames(length, n_fft, hop_length) for length in num_samples]
+        assert seq_lengths.tolist() == [99, 76, 55]
+
+
+class TestFeatureDtype(unittest.TestCase):
+    def _collate_features(self, trainer_configs):
+        configs = build_dummy_configs(trainer_configs=trainer_configs, audio_configs=SpectrogramConfigs())
+        # selects the audio config dataclass from AUDIO_FEATURE_TRANSFORM_DATACLASS_REGISTRY in the dataset
+        configs['name'] = 'spectrogram'
+        dataset = SpeechToTextDataset(
+            configs=configs,
+            dataset_path='',
+            audio_paths=['dummy.wav', 'dummy.wav'],
+            transcripts=['1 3 3 2', '1 3 2'],
+        )
+        # an unreadable file makes _parse_audio fall back to a zero feature, which needs no audio on disk
+        dataset._load_audio = lambda *args, **kwargs: None
+
+        feature = dataset._parse_audio('dummy.wav')
+        assert feature.dtype == dataset.feature_dtype
+
+        batch = [(feature, [1, 3, 3, 2]), (dataset._parse_audio('dummy.wav'), [1, 3, 2])]
+        return _collate_fn(batch)[0]
+
+    def test_gpu_fp16_features_are_half(self):
+        assert self._collate_features(Fp16GPUTrainerConfigs()).dtype == torch.float16
+
+    def test_tpu_fp16_features_are_float(self):
+        assert self._collate_features(Fp16TPUTrainerConfigs()).dtype == torch.float32
+
+    def test_cpu_features_are_float(self):
+        assert self._collate_features(CPUTrainerConfigs()).dtype == torch.float32
+
+
+if __name__ == '__main__':
+    unittest.main()
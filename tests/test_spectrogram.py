@@ -0,0 +1,93 @@
+import unittest
+import numpy as np
+import torch
+
+from openspeech.data.audio.spectrogram.configuration import SpectrogramConfigs, get_num_frames, get_stft_parameters
+from openspeech.data.audio.spectrogram.spectrogram import SpectrogramFeatureTransform
+from openspeech.data.data_loader import _collate_fn
+from openspeech.modules import BatchedSpectrogram
+from openspeech.utils import build_dummy_configs
+
+
+def _torch_stft_feature(signal: np.ndarray, n_fft: int, hop_length: int, num_mels: int) -> np.ndarray:
+    stft = torch.stft(
+        torch.from_numpy(signal),
+        n_fft,
+        hop_length=hop_length,
+        window=torch.hamming_window(n_fft),
+        center=False,
+        return_complex=True,
+    )
+    return stft.abs().log1p()[:num_mels].numpy()
+
+
+class TestSpectrogramFeatureTransform(unittest.TestCase):
+    def setUp(self):
+        self.signal = np.random.RandomState(0).randn(16000).astype(np.float32)
+
+    def _check_against_torch_stft(self, num_mels: int):
+        configs = build_dummy_configs(audio_configs=SpectrogramConfigs(num_mels=num_mels))
+        n_fft, hop_length = get_stft_parameters(configs.audio)
+
+        feature = SpectrogramFeatureTransform(configs)._get_feature(self.signal)
+        expected = _torch_stft_feature(self.signal, n_fft, hop_length, num_mels)
+
+        assert feature.shape == (num_mels, get_num_frames(len(self.signal), n_fft, hop_length))
+        assert feature.dtype == np.float32
+        np.testing.assert_allclose(feature, expected, rtol=1e-5, atol=1e-5)
+
+    def test_matches_torch_stft(self):
+        self._check_against_torch_stft(num_mels=161)
+
+    def test_retains_num_mels_bins(self):
+        self._check_against_torch_stft(num_mels=80)
+
+    def test_too_many_bins(self):
+        configs = build_dummy_configs(audio_configs=SpectrogramConfigs(num_mels=162))
+        with self.assertRaises(ValueError):
+            SpectrogramFeatureTransform(configs)
+
+
+class TestBatchedSpectrogram(unittest.TestCase):
+    def setUp(self):
+        self.configs = build_dummy_configs(audio_configs=SpectrogramConfigs(extract_on_device=True))
+        self.n_fft, self.hop_length = get_stft_parameters(self.configs.audio)
+        random_state = np.random.RandomState(0)
+        # longest first, as _collate_fn sorts the batch by length
+        self.signals = [random_state.randn(length).astype(np.float32) for length in (16050, 12345, 9000)]
+        self.inputs, _, self.input_lengths, _ = _collate_fn(
+            [(torch.from_numpy(signal), [1, 3, 3, 2]) for signal in self.signals],
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+        )
+        self.spectrogram = BatchedSpectrogram(
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+            num_mels=self.configs.audio.num_mels,
+        )
+
+    def test_matches_data_loader_features(self):
+        transform = SpectrogramFeatureTransform(self.configs)
+        outputs, output_lengths = self.spectrogram(self.inputs, self.input_lengths)
+
+        for idx, signal in enumerate(self.signals):
+            # normalized the same way as SpeechToTextDataset._parse_audio
+            feature = transform._get_feature(signal)
+            feature = ((feature - feature.mean()) / np.std(feature)).T
+            length = output_lengths[idx].item()
+
+            assert length == feature.shape[0]
+            np.testing.assert_allclose(outputs[idx, :length].numpy(), feature, rtol=1e-4, atol=1e-4)
+            assert (outputs[idx, length:] == 0).all()
+
+    def test_scripted_matches_eager(self):
+        scripted = torch.jit.script(self.spectrogram)
+        outputs, output_lengths = self.spectrogram(self.inputs, self.input_lengths)
+        scripted_outputs, scripted_output_lengths = scripted(self.inputs, self.input_lengths)
+
+        assert torch.equal(output_lengths, scripted_output_lengths)
+        assert torch.allclose(outputs, scripted_outputs)
+
+
+if __name__ == '__main__':
+    unittest.main()